@@ -1,33 +1,159 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, simpledialog
 import csv
+import io
+from collections import defaultdict
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
 import os
 
 FILE_NAME = "expenses.csv"
+HEADER = ["date", "category", "description", "amount"]
+IO_BUFFER = 1 << 20
+TREE_BATCH = 500
+
+# Column positions of a parsed expense row
+DATE, CATEGORY, DESC, AMOUNT = 0, 1, 2, 3
 
 # ---------- File Setup ----------
 def ensure_file_exists():
     if not os.path.exists(FILE_NAME):
         with open(FILE_NAME, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
-            writer.writerow(["date", "category", "description", "amount"])
+            writer.writerow(HEADER)
+
+# ---------- Date Parsing ----------
+def parse_date(date_str):
+    # Zero-padded YYYY-MM-DD is sliced directly; anything else (e.g. 2024-1-5)
+    # goes through strptime so the accepted input stays the same
+    digits = date_str[0:4] + date_str[5:7] + date_str[8:10]
+    if (len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-"
+            and digits.isascii() and digits.isdigit()):
+        return datetime(int(date_str[0:4]), int(date_str[5:7]),
+                        int(date_str[8:10]))
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+# ---------- Amounts ----------
+CENT = Decimal("0.01")
+
+def to_cents(amount_str):
+    # Half-up to whole cents; raises ValueError/ArithmeticError on bad input,
+    # including nan, inf and amounts too large to hold exactly
+    return int(Decimal(amount_str).quantize(CENT, rounding=ROUND_HALF_UP) * 100)
+
+def format_cents(cents):
+    return str(Decimal(cents).scaleb(-2))
+
+# ---------- Expense Cache ----------
+# Parsed rows are kept in memory and reused while the file's
+# (mtime, size) stays the same. "months" maps "YYYY-MM" to that month's
+# rows and "totals" maps it to {category: cents}; both are kept up to
+# date alongside the rows. "bad_rows" counts rows skipped at load.
+_CACHE = {"key": None, "rows": [], "months": {}, "totals": {},
+          "bad_rows": 0}
+
+def _file_key():
+    st = os.stat(FILE_NAME)
+    return (st.st_mtime_ns, st.st_size)
 
 # ---------- Add Expense ----------
-def add_expense(date, category, description, amount):
-    with open(FILE_NAME, "a", newline="", encoding="utf-8") as f:
+def add_expense(date, category, description, cents, f=None):
+    # cents: the amount from to_cents(); f: an already open append handle
+    # on FILE_NAME to reuse
+    fresh = _CACHE["key"] is not None and _CACHE["key"] == _file_key()
+
+    # Amounts are stored with two decimals and totalled in the same cents
+    row = [date, category, description, format_cents(cents)]
+    if f is None:
+        with open(FILE_NAME, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(row)
+    else:
         writer = csv.writer(f)
-        writer.writerow([date, category, description, amount])
+        writer.writerow(row)
+        f.flush()
+
+    # Keep the cache in sync instead of re-reading the whole file
+    if fresh:
+        _CACHE["rows"].append(row)
+        _CACHE["months"].setdefault(date[:7], []).append(row)
+        _CACHE["totals"][date[:7]][category] += cents
+        _CACHE["key"] = _file_key()
+    else:
+        _CACHE["key"] = None
+    return row
+
+# ---------- Append Handle ----------
+def open_append():
+    return open(FILE_NAME, "a", newline="", encoding="utf-8",
+                buffering=1 << 16)
+
+def same_file(f):
+    # False once FILE_NAME was replaced, e.g. by a spreadsheet saving
+    # through write-and-rename; f then points at the old, unlinked file
+    st = os.stat(FILE_NAME)
+    fst = os.fstat(f.fileno())
+    return (st.st_dev, st.st_ino) == (fst.st_dev, fst.st_ino)
+
+# ---------- Read Rows ----------
+def _read_rows(f):
+    reader = csv.reader(f)
+    next(reader, None)  # header
+    # Unlike DictReader, csv.reader returns [] for blank lines; extra
+    # fields (e.g. a trailing comma) are dropped, short rows are kept so
+    # read_expenses() can count them as bad
+    return (row[:len(HEADER)] for row in reader if row)
 
 # ---------- Read All Expenses ----------
 def read_expenses():
+    key = _file_key()
+    if key == _CACHE["key"]:
+        return _CACHE["rows"]
+
     expenses = []
-    with open(FILE_NAME, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
+    months = defaultdict(list)
+    totals = defaultdict(lambda: defaultdict(int))
+    bad_rows = 0
+    with open(FILE_NAME, newline="", encoding="utf-8",
+              buffering=IO_BUFFER) as f:
+        for row in _read_rows(f):
+            if len(row) != len(HEADER):
+                bad_rows += 1
+                continue
+            date, category, _, amount = row
+            # Dates and amounts are checked once here so reports can trust
+            # them; older files may hold unpadded dates such as 2024-1-5
+            try:
+                date = row[DATE] = parse_date(date).date().isoformat()
+                cents = to_cents(amount)
+            except (ValueError, ArithmeticError):
+                bad_rows += 1
+                continue
             expenses.append(row)
+            months[date[:7]].append(row)
+            totals[date[:7]][category] += cents
+
+    _CACHE["key"] = key
+    _CACHE["rows"] = expenses
+    _CACHE["months"] = months
+    _CACHE["totals"] = totals
+    _CACHE["bad_rows"] = bad_rows
     return expenses
 
+# ---------- Monthly Expenses ----------
+def month_key(year, month):
+    # Dates are stored as YYYY-MM-DD, so the first 7 characters are the month
+    return f"{year:04d}-{month:02d}"
+
+def month_expenses(year, month):
+    read_expenses()  # refresh the cache if the file changed
+    return _CACHE["months"].get(month_key(year, month), [])
+
+# ---------- Monthly Totals ----------
+def month_totals(year, month):
+    read_expenses()  # refresh the cache if the file changed
+    return _CACHE["totals"].get(month_key(year, month), {})
+
 # ---------- GUI App ----------
 class FinanceTrackerApp:
     def __init__(self, root):
@@ -36,9 +162,19 @@ class FinanceTrackerApp:
         self.root.geometry("700x550")
         self.root.resizable(False, False)
 
+        # after_idle id of the next pending load or Treeview batch, and the
+        # cached row list that load is inserting from
+        self._pending_load = None
+        self._load_rows = None
+
         ensure_file_exists()
+        # Kept open for the lifetime of the window, closed in on_close()
+        self._append_fh = open_append()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
         self.build_ui()
-        self.load_expenses()
+        # Let the window draw first; rows then fill in TREE_BATCH at a time
+        self._pending_load = self.root.after_idle(self.load_expenses)
 
     # ---------- UI ----------
     def build_ui(self):
@@ -67,7 +203,7 @@ class FinanceTrackerApp:
                   command=self.add_expense_ui).grid(row=1, column=4, padx=5)
 
         # Table
-        columns = ("date", "category", "description", "amount")
+        columns = HEADER
         self.tree = ttk.Treeview(self.root, columns=columns, show="headings", height=12)
 
         for col in columns:
@@ -88,13 +224,41 @@ class FinanceTrackerApp:
 
     # ---------- Load Expenses ----------
     def load_expenses(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
-        for exp in read_expenses():
-            self.tree.insert("", "end",
-                             values=(exp["date"], exp["category"],
-                                     exp["description"], exp["amount"]))
+        if self._pending_load:
+            self.root.after_cancel(self._pending_load)
+            self._pending_load = None
+
+        self.tree.delete(*self.tree.get_children())
+
+        rows = self._load_rows = read_expenses()
+        self.insert_batch(rows, 0)
+
+        if _CACHE["bad_rows"]:
+            messagebox.showwarning(
+                "Warning", f"Skipped {_CACHE['bad_rows']} row(s) in "
+                           f"{FILE_NAME} with missing fields or an invalid "
+                           f"date or amount")
+
+    def insert_batch(self, rows, start):
+        # Insert a slice of rows, then yield to the event loop for the rest.
+        # rows is the live cached list, so rows added meanwhile are included.
+        stop = min(start + TREE_BATCH, len(rows))
+        for i in range(start, stop):
+            self.tree.insert("", "end", values=rows[i])
+
+        if stop < len(rows):
+            self._pending_load = self.root.after_idle(
+                self.insert_batch, rows, stop)
+        else:
+            self._pending_load = None
+
+    # ---------- Append Handle ----------
+    def append_handle(self):
+        ensure_file_exists()
+        if not same_file(self._append_fh):
+            self._append_fh.close()
+            self._append_fh = open_append()
+        return self._append_fh
 
     # ---------- Add Expense UI ----------
     def add_expense_ui(self):
@@ -104,8 +268,9 @@ class FinanceTrackerApp:
         amount = self.amount_entry.get().strip()
 
         try:
-            datetime.strptime(date, "%Y-%m-%d")
-            amount = float(amount)
+            # Store dates zero-padded so month lookups can match on prefix
+            date = parse_date(date).date().isoformat()
+            cents = to_cents(amount)
         except:
             messagebox.showerror("Error", "Invalid date or amount")
             return
@@ -114,8 +279,18 @@ class FinanceTrackerApp:
             messagebox.showerror("Error", "All fields are required")
             return
 
-        add_expense(date, category, desc, amount)
-        self.load_expenses()
+        row = add_expense(date, category, desc, cents, self.append_handle())
+        if _CACHE["key"] is None:
+            # The file changed outside the app; reload so the table matches it
+            self.load_expenses()
+        else:
+            # A pending load already covers the new row: the initial load
+            # reads it from the file, later batches from the cached rows
+            loading = self._pending_load and (
+                self._load_rows is None
+                or (self._load_rows and self._load_rows[-1] is row))
+            if not loading:
+                self.tree.insert("", "end", values=row)
 
         self.date_entry.delete(0, tk.END)
         self.category_entry.delete(0, tk.END)
@@ -129,32 +304,24 @@ class FinanceTrackerApp:
             messagebox.showinfo("Info", "No expenses found")
             return
 
-        month = tk.simpledialog.askinteger("Month", "Enter month (1-12):")
-        year = tk.simpledialog.askinteger("Year", "Enter year:")
+        month = simpledialog.askinteger("Month", "Enter month (1-12):")
+        year = simpledialog.askinteger("Year", "Enter year:")
 
         if not month or not year:
             return
 
-        category_totals = {}
-        total = 0
-
-        for exp in expenses:
-            y, m, _ = exp["date"].split("-")
-            if int(y) == year and int(m) == month:
-                amt = float(exp["amount"])
-                total += amt
-                category_totals[exp["category"]] = category_totals.get(exp["category"], 0) + amt
-
+        category_totals = month_totals(year, month)
         if not category_totals:
             messagebox.showinfo("Info", "No expenses for this month")
             return
 
-        report = f"Monthly Report {year}-{month:02d}\n\n"
-        for cat, amt in category_totals.items():
-            report += f"{cat}: ₹{amt:.2f}\n"
+        total = sum(category_totals.values())
 
-        report += f"\nGrand Total: ₹{total:.2f}"
-        messagebox.showinfo("Report", report)
+        lines = [f"Monthly Report {year}-{month:02d}", ""]
+        lines += [f"{cat}: ₹{cents / 100:.2f}"
+                  for cat, cents in category_totals.items()]
+        lines += ["", f"Grand Total: ₹{total / 100:.2f}"]
+        messagebox.showinfo("Report", "\n".join(lines))
 
     # ---------- Export Monthly ----------
     def export_monthly_report(self):
@@ -163,25 +330,31 @@ class FinanceTrackerApp:
             messagebox.showinfo("Info", "No expenses found")
             return
 
-        month = tk.simpledialog.askinteger("Month", "Enter month (1-12):")
-        year = tk.simpledialog.askinteger("Year", "Enter year:")
+        month = simpledialog.askinteger("Month", "Enter month (1-12):")
+        year = simpledialog.askinteger("Year", "Enter year:")
 
         if not month or not year:
             return
 
         filename = f"report_{year}_{month:02d}.csv"
 
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["date", "category", "description", "amount"])
+        # Serialize the whole report first, then hand it to the file in one write
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(HEADER)
+        writer.writerows(month_expenses(year, month))
 
-            for exp in expenses:
-                y, m, _ = exp["date"].split("-")
-                if int(y) == year and int(m) == month:
-                    writer.writerow(exp.values())
+        with open(filename, "w", newline="", encoding="utf-8",
+                  buffering=IO_BUFFER) as f:
+            f.write(buf.getvalue())
 
         messagebox.showinfo("Exported", f"Report saved as {filename}")
 
+    # ---------- Close ----------
+    def on_close(self):
+        self._append_fh.close()
+        self.root.destroy()
+
 # ---------- Run ----------
 if __name__ == "__main__":
     root = tk.Tk()